@@ -14,6 +14,7 @@ from pathlib import Path
 
 import metomi.isodatetime.parsers as parse
 from constants import (
+    BRANCH_DATETIME_FIELDS,
     DATA,
     DATETIME_FIELDS,
     META_FIELDS,
@@ -29,7 +30,10 @@ from metomi.isodatetime.exceptions import ISO8601SyntaxError, IsodatetimeError
 REGEX_DICT = {
     "workflow_pattern": re.compile(REGEX_FORMAT["model_workflow_id"]),
     "variant_pattern": re.compile(REGEX_FORMAT["variant_label"]),
+    "issue_field_pattern": re.compile(r"### (.+?)\n\s*\n?(.+)"),
 }
+# A single datetime parser is shared, since creating one compiles its full set of ISO 8601 patterns.
+TIMEPOINT_PARSER = parse.TimePointParser()
 
 
 def get_issue() -> dict[str, str]:
@@ -86,8 +90,7 @@ def normalise_datetime(datetime: str, errors: dict[str, str], key: str) -> tuple
         The normalised string and the dictionary of errors.
     """
     try:
-        parser = parse.TimePointParser()
-        normalised_str = str(parser.parse(datetime))
+        normalised_str = str(TIMEPOINT_PARSER.parse(datetime))
     except (IsodatetimeError, ISO8601SyntaxError):
         errors["datetime"] = f"Invalid datetime format for {key}"
         normalised_str = datetime
@@ -141,6 +144,11 @@ def validate_meta_content(meta_dict: dict[str, str]) -> dict[str, str]:
         A dictionary containing any errors caused by user input from the form.
     """
     errors = set_calendar(meta_dict["calendar"])
+    # Branch dates are only checked for "standard" branching, regardless of where they appear relative to branch_method
+    if meta_dict.get("branch_method") == "standard":
+        datetime_fields = DATETIME_FIELDS | BRANCH_DATETIME_FIELDS
+    else:
+        datetime_fields = DATETIME_FIELDS
     # Confirm that conditional fields are present.
     for key, value in meta_dict.items():
         if key in REQUIRED and not value:
@@ -163,10 +171,7 @@ def validate_meta_content(meta_dict: dict[str, str]) -> dict[str, str]:
                         errors["unexpected_parent_field"] = f"Unexpected field: {parent_key}"
 
         # Verify datetime inputs
-        if key == "branch_method" and value == "standard":
-            DATETIME_FIELDS.add("branch_date_in_child")
-            DATETIME_FIELDS.add("branch_date_in_parent")
-        if key in DATETIME_FIELDS:
+        if key in datetime_fields:
             normal_datetime, errors = normalise_datetime(meta_dict[key], errors, key)
             meta_dict[key] = normal_datetime
 
@@ -183,9 +188,8 @@ def validate_meta_content(meta_dict: dict[str, str]) -> dict[str, str]:
             errors["timestep_logic"] = "Atmospheric timestep is invalid"
 
     # Confirm that end_time is not earlier than start_time.
-    parser = parse.TimePointParser()
     if "datetime" not in errors:
-        if parser.parse(meta_dict["end_date"]) < parser.parse(meta_dict["start_date"]):
+        if TIMEPOINT_PARSER.parse(meta_dict["end_date"]) < TIMEPOINT_PARSER.parse(meta_dict["start_date"]):
             errors["datetime_logic"] = "End date cannot be earlier than start date"
 
     return errors
@@ -298,7 +302,7 @@ def main() -> None:
     issue_body = get_issue()['body']
 
     # Find key-value pairs and map them to dictionary process.
-    match = re.findall(r"### (.+?)\n\s*\n?(.+)", issue_body)
+    match = REGEX_DICT["issue_field_pattern"].findall(issue_body)
     meta_dict = process_metadata(match)
     print("Extracting issue body...  SUCCESSFUL")
 
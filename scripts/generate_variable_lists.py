@@ -8,7 +8,7 @@ such as priority level and production labels. Each variable is labelled accordin
 Each variable list is then saved to a plain text file containing the variables for that experiment.
 
 THIS SCRIPT CURRENTLY CONSIDERS GLOBAL VARIABLES ONLY. NON-GLOBAL VARIABLES ARE FILTERED OUT WITHIN THE FUNCTION
-format_variable_names().
+get_variable_names().
 
 Example command line usage:
 "python scripts/generate_variable_lists.py reference_information/dr-1.2.2.2_all.json reference_information/mappings.json
@@ -18,13 +18,18 @@ Example command line usage:
 
 import argparse
 import json
-import os
+import sys
 from itertools import chain
 from pathlib import Path
-from typing import Union
+from typing import Optional, Union
 
-IGNORED_PRIORITIES = ("med", "low")
-PRIORITY_ORDER = {"# priority=medium": 1, "# priority=low": 2, "# do-not-produce": 3}
+# orjson is optional and considerably faster than the standard library for the large source files.
+try:
+    from orjson import loads as json_loads
+except ImportError:
+    from json import loads as json_loads
+
+PRIORITY_ORDER = {" # priority=medium": 1, " # priority=low": 2, " # do-not-produce": 3}
 
 
 def set_arg_parser() -> argparse.Namespace:
@@ -53,7 +58,7 @@ def set_arg_parser() -> argparse.Namespace:
     return parser.parse_args()
 
 
-def open_source_jsons(path: Path) -> Union[dict, list[dict]]:
+def open_source_jsons(path: Path) -> Optional[Union[dict, list[dict]]]:
     """Opens and reads a single JSON file.
 
     Parameters
@@ -63,45 +68,33 @@ def open_source_jsons(path: Path) -> Union[dict, list[dict]]:
 
     Returns
     -------
-    Union[dict, list[dict]]
-        The JSON file content.
-
-    Raises
-    ------
-    FileNotFoundError
-        If the file does not exist at the given path.
-    json.JSONDecodeError
-        If the JSON file structure is invalid.
+    Optional[Union[dict, list[dict]]]
+        The JSON file content, or None if the file does not exist or its JSON structure is invalid.
     """
     try:
-        with open(path, "r") as f:
-            file = json.load(f)
+        return json_loads(path.read_bytes())
 
     except FileNotFoundError:
         print(f"File not found: {path}.")
     except json.JSONDecodeError as err:
-        print(f"Invalid JSON formatting: {err}")
+        print(f"Invalid JSON formatting in {path}: {err}")
 
-    return file
+    return None
 
 
-def get_grouped_priority_labels(experiment_dict: dict, experiment: str) -> dict[str, set]:
+def get_grouped_priority_labels(experiment_data: dict) -> dict[str, set]:
     """Creates a dictionary of labels grouped by priority (core, high, med, low) for a single experiment.
 
     Parameters
     ----------
-    experiment_dict: dict
-        The dictionary containing all experiments and their associated variables.
-    experiment: str
-        The experiment whose variables are being updated.
+    experiment_data: dict
+        The variables for a single experiment grouped by priority level.
 
     Returns
     -------
     dict[str, set]
         A dictionary of labels grouped by priority (core, high, med, low).
     """
-    experiment_data = experiment_dict["experiment"][experiment]
-
     return {
         "core": set(experiment_data.get("Core", [])),
         "high": set(experiment_data.get("High", [])),
@@ -110,115 +103,76 @@ def get_grouped_priority_labels(experiment_dict: dict, experiment: str) -> dict[
     }
 
 
-def set_priority_comments(experiment_dict: dict, experiment: str) -> dict[str, str]:
-    """Sets the comment to be appended to each variable based off of their priority level for a single experiment.
+def update_variables_with_priority(priority_dict: dict[str, set], variable_dict: dict) -> dict[str, str]:
+    """Update the variables for a single experiment with priority comments.
 
     Parameters
     ----------
-    experiment_dict: dict
-        The dictionary containing all experiments and their associated variables.
-    experiment: str
-        The experiment whose variables are being updated.
+    priority_dict: dict[str, set]
+        A dictionary of labels grouped by priority (core, high, med, low) for a single experiment.
+    variable_dict: dict
+        A dictionary to populate with the updated variable data.
 
     Returns
     -------
     dict[str, str]
-        A dictionary of comments created based on priority level.
-    """
-    priority_comments = {}
-    priority_dict = get_grouped_priority_labels(experiment_dict, experiment)
-    for level, variables in priority_dict.items():
-        if level in IGNORED_PRIORITIES:
-            for variable in variables:
-                priority_comments[variable] = f" # priority={"medium" if level == "med" else "low"}"
-
-    return priority_comments
-
-
-def get_all_variables(experiment_dict: dict, experiment: str) -> chain:
-    """Creates a chain of all variables used for a single experiment.
-
-    Parameters
-    ----------
-    experiment_dict: dict
-        The dictionary containing all experiments and their associated variables.
-    experiment: str
-        The experiment whose variables are being updated.
-
-    Returns
-    -------
-    chain
-        A chain of all priority labels.
+        A dictionary of variable name and priority level key-value pairs for a single experiment.
     """
-    priority_dict = get_grouped_priority_labels(experiment_dict, experiment)
+    # Comment out medium and low priority variables, applied in order so the lowest listed priority takes precedence.
+    variable_dict.update(dict.fromkeys(priority_dict["core"], ""))
+    variable_dict.update(dict.fromkeys(priority_dict["high"], ""))
+    variable_dict.update(dict.fromkeys(priority_dict["med"], " # priority=medium"))
+    variable_dict.update(dict.fromkeys(priority_dict["low"], " # priority=low"))
 
-    return chain(priority_dict["core"], priority_dict["high"], priority_dict["med"], priority_dict["low"])
+    return variable_dict
 
 
-def update_variables_with_priority(experiment_dict: dict, experiment: str, variable_dict: dict) -> dict[str, str]:
-    """Update the variables for a single experiment with priority comments.
+def index_mappings(mappings_dict: list[dict]) -> dict[str, dict]:
+    """Creates a lookup of mapping information keyed by branded variable name so that each variable can be found
+    without scanning the whole of mappings.json.
 
     Parameters
     ----------
-    experiment_dict: dict
-        The dictionary containing all experiments and their associated variables.
-    experiment: str
-        The experiment whose variables are being updated.
-    variable_dict: dict
-        A dictionary to populate with the updated variable data.
+    mappings_dict: list[dict]
+        The dictionary containing mapping information for all variables.
 
     Returns
     -------
-    dict[str, str]
-        A dictionary of variable name and priority level key-value pairs for a single experiment.
+    dict[str, dict]
+        The mapping information for each variable. Where a variable is listed more than once, the first entry is kept.
     """
-    priority_comments = set_priority_comments(experiment_dict, experiment)
-    all_labels = get_all_variables(experiment_dict, experiment)
+    mapping_index = {}
+    for mapping in mappings_dict:
+        mapping_index.setdefault(mapping["branded_variable"], mapping)
 
-    # Check all labels against their priority status and comment accordingly.
-    for variable in all_labels:
-        variable_dict[variable] = priority_comments.get(variable, "")
+    return mapping_index
 
-    return variable_dict
 
-
-def get_mapping(mappings_dict: list[dict], variable: str) -> dict:
-    """Identifies the correct dictionary within the mappings.json to read from.
+def get_not_produced(mapping_index: dict[str, dict]) -> set[str]:
+    """Creates a set of all variables labelled "do-not-produce". Labels do not depend on the experiment, so this only
+    needs to be done once for all experiments.
 
     Parameters
     ----------
-    mappings_dict: list[dict]
-        The dictionary containing mapping information for all variables.
-    variable: str
-        The variable whose mapping information is required.
+    mapping_index: dict[str, dict]
+        The mapping information for all variables keyed by branded variable name.
 
     Returns
     -------
-    dict
-        The mapping information for a single variable.
+    set[str]
+        The variables marked as "do-not-produce".
     """
-    for mapping in mappings_dict:
-        if variable == mapping["branded_variable"]:
-            mapping = mapping
-            break
-
-    return mapping
+    return {variable for variable, mapping in mapping_index.items() if "do-not-produce" in mapping.get("labels", [])}
 
 
-def identify_not_produced(
-    experiment_dict: dict, experiment: str, mappings_dict: list[dict], variable_dict: dict[str, str]
-) -> dict[str, str]:
+def identify_not_produced(not_produced: set[str], variable_dict: dict[str, str]) -> dict[str, str]:
     """Identify all variables marked as "do not produce" in a single experiment. Overriding any existing "priority"
     value in the dict is acceptable since do-not-produce takes precedence.
 
     Parameters
     ----------
-    experiment_dict: dict
-        The dictionary containing all experiments and their associated variables.
-    experiment: str
-        The experiment whose variables are being updated.
-    mappings_dict: list[dict]
-        The dictionary containing mapping information for all variables.
+    not_produced: set[str]
+        The variables marked as "do-not-produce".
     variable_dict: dict[str, str]
         The dictionary of name and priority level key-value pairs for a single experiment.
 
@@ -227,79 +181,56 @@ def identify_not_produced(
     dict[str, str]
         An updated dictionary containing production status for variables marked "do-not-produce".
     """
-    all_labels = get_all_variables(experiment_dict, experiment)
-    for variable in all_labels:
-        mapping = get_mapping(mappings_dict, variable)
-        labels = mapping.get("labels")
-
-        if "do-not-produce" in labels:
-            variable_dict[variable] = " # do-not-produce"
+    for variable in variable_dict.keys() & not_produced:
+        variable_dict[variable] = " # do-not-produce"
 
     return variable_dict
 
 
-def get_streams(experiment_dict: dict, experiment: str, mappings_dict: list[dict]) -> dict[str, str]:
-    """Creates a dictionary for variables and their associated output stream for a single experiment.
+def get_streams(mapping_index: dict[str, dict]) -> dict[str, str]:
+    """Creates a dictionary for variables and their associated output stream. Streams do not depend on the experiment,
+    so this only needs to be done once for all experiments.
 
     Parameters
     ----------
-    experiment_dict: dict
-        The dictionary containing all experiments and their associated variables.
-    experiment: str
-        The experiment whose variables are being updated.
-    mappings_dict: list[dict]
-        The dictionary containing mapping information for all variables.
+    mapping_index: dict[str, dict]
+        The mapping information for all variables keyed by branded variable name.
 
     Returns
     -------
     dict[str, str]
-        A dictionary containing variables and their associated output stream.
+        A dictionary containing variables and their associated output stream, or an empty string if none is listed.
     """
-    streams = {}
+    return {variable: mapping.get("stream") or "" for variable, mapping in mapping_index.items()}
 
-    # Access stash entries for each variable and check if it contains values.
-    all_labels = get_all_variables(experiment_dict, experiment)
-    for variable in all_labels:
-        mapping = get_mapping(mappings_dict, variable)
-        streams[variable] = mapping.get("stream")
 
-    return streams
-
-
-def reformat_variable_names(
-    experiment_dict: dict, experiment: str, mappings_dict: list[dict], variable_dict: dict
-) -> dict[str, str]:
-    """Reformats the name of each variable from realm.variable.branding.frequency.region to
-    realm/variable_branding@frequency:stream for a single experiment.
+def get_variable_names(variables: set[str], streams: dict[str, str]) -> dict[str, str]:
+    """Creates a dictionary of reformatted names from realm.variable.branding.frequency.region to
+    realm/variable_branding@frequency:stream. Reformatted names do not depend on the experiment, so each variable is
+    only reformatted once for all experiments.
 
     Parameters
     ----------
-    experiment_dict: dict
-        The dictionary containing all experiments and their associated variables.
-    experiment: str
-        The experiment whose variables are being updated.
-    mappings_dict: list[dict]
-        The dictionary containing mapping information for all variables.
-    variable_dict: dict
-        An updated dictionary containing production status for variables marked "do-not-produce".
+    variables: set[str]
+        All variables used by the experiments being processed.
+    streams: dict[str, str]
+        A dictionary containing variables and their associated output stream.
 
     Returns
     -------
     dict[str, str]
-        An updated dictionary containing the reformatted variable names as keys and priority/production status as
-        values.
+        The reformatted name of each global variable. Non global variables are not included.
 
     Raises
     ------
     KeyError
         If the original variable name cannot be split into parts as expected.
     """
-    renamed_variable_dict = {}
-    streams = get_streams(experiment_dict, experiment, mappings_dict)
+    variable_names = {}
 
     # Reformat all original variable names to realm/variable_branding@frequency:stream.
-    for variable, comment in variable_dict.items():
-        parts = variable.split(".")
+    for variable in variables:
+        parts = variable.split(".", 5)
         if len(parts) < 5:
             raise KeyError(f"{variable} has unexpected format. Expected: realm.variable.branding.frequency.region")
 
@@ -308,55 +239,54 @@ def reformat_variable_names(
 
         # Filter out any non global variables
         if region in ("glb", "GLB"):
-            new_variable_name = (f"{realm}/{variable_name}_{branding}@{frequency}:{stream}" if stream else
-                                 f"{realm}/{variable_name}_{branding}@{frequency}")
-
-            # Create new dictionary with the reformatted variable names to avoid key errors in the original dict.
-            renamed_variable_dict[new_variable_name] = comment
+            variable_names[variable] = (f"{realm}/{variable_name}_{branding}@{frequency}:{stream}" if stream else
+                                        f"{realm}/{variable_name}_{branding}@{frequency}")
 
-    return renamed_variable_dict
+    return variable_names
 
 
-def format_outfile_content(renamed_variable_dict: dict[str, str]) -> list[str]:
-    """Reformats the key value pairs into single line plain text for a single experiment.
+def reformat_variable_names(variable_names: dict[str, str], variable_dict: dict) -> dict[str, str]:
+    """Renames each variable for a single experiment to its reformatted name, leaving out any non global variables.
 
     Parameters
     ----------
-    renamed_variable_dict: dict[str, str]
-        An updated dictionary containing the reformatted variable names as keys and priority/production status as
-        values.
+    variable_names: dict[str, str]
+        The reformatted name of each global variable.
+    variable_dict: dict
+        An updated dictionary containing production status for variables marked "do-not-produce".
 
     Returns
     -------
-    list[str]
-        A list of lines to populate the plain text file with.
+    dict[str, str]
+        An updated dictionary containing the reformatted variable names as keys and priority/production status as
+        values.
     """
-    lines = []
-    for variable, comment in renamed_variable_dict.items():
-        lines.append(f"#{variable}{comment}\n" if comment else f"{variable}{comment}\n")
-
-    return lines
+    # Create new dictionary with the reformatted variable names to avoid key errors in the original dict.
+    return {
+        variable_names[variable]: comment for variable, comment in variable_dict.items() if variable in variable_names
+    }
 
 
-def sort_key(line: str) -> tuple[dict[str, int], int]:
-    """The custom sort function passed to the sorted() function to define the variable order for a single experiment.
+def format_outfile_content(renamed_variable_dict: dict[str, str]) -> list[tuple[int, str]]:
+    """Reformats the key value pairs into single line plain text for a single experiment, paired with the order of
+    each line based on priority.
 
     Parameters
     ----------
-    line: str
-        A single line containing a single variable name and associated comments.
+    renamed_variable_dict: dict[str, str]
+        An updated dictionary containing the reformatted variable names as keys and priority/production status as
+        values.
 
     Returns
     -------
-    tuple[dict[str, int], int]
-        The order of each label based on priority, variables with no specified priority will be assigned order 0 so that
-        they appear at the top of the variable list.
+    list[tuple[int, str]]
+        A list of order and line pairs to populate the plain text file with. Variables with no specified priority are
+        assigned order 0 so that they appear at the top of the variable list.
     """
-    for label in PRIORITY_ORDER:
-        if label in line:
-            return PRIORITY_ORDER[label]
-
-    return 0
+    return [
+        (PRIORITY_ORDER.get(comment, 0), f"#{variable}{comment}\n" if comment else f"{variable}\n")
+        for variable, comment in renamed_variable_dict.items()
+    ]
 
 
 def save_outfile(outdir: Path, experiment: str, renamed_variable_dict: dict[str, str]) -> None:
@@ -373,11 +303,43 @@ def save_outfile(outdir: Path, experiment: str, renamed_variable_dict: dict[str,
         values.
     """
     outfile = outdir / f"{experiment}.txt"
-    lines = format_outfile_content(renamed_variable_dict)
+    # Group lines by order instead of sorting them, which keeps their relative position within each group.
+    grouped_lines = [[] for _ in range(len(PRIORITY_ORDER) + 1)]
+    for order, line in format_outfile_content(renamed_variable_dict):
+        grouped_lines[order].append(line)
 
     with open(outfile, "w") as f:
-        for line in sorted(lines, key=sort_key):
-            f.write(line)
+        f.writelines(chain.from_iterable(grouped_lines))
+
+
+def generate_experiment_variable_list(
+    experiment: str,
+    priority_dict: dict[str, set],
+    not_produced: set[str],
+    variable_names: dict[str, str],
+    outdir: Path,
+) -> None:
+    """Generates and saves the variable list for a single experiment. Each experiment only reads the shared source
+    data and writes its own file, so experiments do not depend on one another.
+
+    Parameters
+    ----------
+    experiment: str
+        The experiment whose variable list is being generated.
+    priority_dict: dict[str, set]
+        A dictionary of labels grouped by priority (core, high, med, low) for the experiment.
+    not_produced: set[str]
+        The variables marked as "do-not-produce".
+    variable_names: dict[str, str]
+        The reformatted name of each global variable.
+    outdir: Path
+        The output directory.
+    """
+    variable_dict = update_variables_with_priority(priority_dict, {})
+    variable_dict = identify_not_produced(not_produced, variable_dict)
+    variable_dict = reformat_variable_names(variable_names, variable_dict)
+
+    save_outfile(outdir, experiment, variable_dict)
 
 
 def generate_variable_lists() -> None:
@@ -388,26 +350,34 @@ def generate_variable_lists() -> None:
     args = set_arg_parser()
     experiment_dict = open_source_jsons(Path(args.dr_info))
     mappings_dict = open_source_jsons(Path(args.mappings))
+    if experiment_dict is None or mappings_dict is None:
+        sys.exit(1)
+
+    mapping_index = index_mappings(mappings_dict)
+    streams = get_streams(mapping_index)
+    not_produced = get_not_produced(mapping_index)
 
     # Create output file path.
     outdir = Path(f"variables_glb/{experiment_dict["Header"]["dreq content version"]}")
-    os.makedirs(outdir, exist_ok=True)
+    outdir.mkdir(parents=True, exist_ok=True)
 
-    # Loop over all listed experiments.
-    for experiment in args.experiments:
-        variable_dict = {}
+    # Group each listed experiment's variables by priority once, for use in both naming and labelling.
+    experiments = experiment_dict["experiment"]
+    priority_dicts = {
+        experiment: get_grouped_priority_labels(experiments[experiment]) for experiment in args.experiments
+    }
 
-        functions = [
-            update_variables_with_priority(experiment_dict, experiment, variable_dict),
-            identify_not_produced(experiment_dict, experiment, mappings_dict, variable_dict),
-            reformat_variable_names(experiment_dict, experiment, mappings_dict, variable_dict),
-        ]
-        for f in functions:
-            variable_dict = f
+    # Reformat the names of all variables used by the listed experiments once, rather than once per experiment.
+    variables = set()
+    for priority_dict in priority_dicts.values():
+        variables.update(*priority_dict.values())
+    variable_names = get_variable_names(variables, streams)
 
-        save_outfile(outdir, experiment, variable_dict)
+    # Loop over all listed experiments.
+    for experiment, priority_dict in priority_dicts.items():
+        generate_experiment_variable_list(experiment, priority_dict, not_produced, variable_names, outdir)
 
-    print(f"SUCCESSFULLY GENERATED {len(args.experiments)} FILES")
+    print(f"SUCCESSFULLY GENERATED {len(priority_dicts)} FILES")
 
 
 if __name__ == "__main__":
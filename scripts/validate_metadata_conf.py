@@ -7,20 +7,18 @@ in workflow configuration files.
 """
 
 import configparser
-import glob
 import re
 import sys
 from pathlib import Path
 
 import metomi.isodatetime.parsers as parse
 from constants import (
-    DATA,
+    BRANCH_DATETIME_FIELDS,
     DATETIME_FIELDS,
-    METADATA,
-    MISC,
     PARENT_REQUIRED,
     REGEX_FORMAT,
     REQUIRED,
+    SECTION_KEYS,
     SECTIONS,
 )
 from metomi.isodatetime.exceptions import ISO8601SyntaxError, IsodatetimeError
@@ -29,23 +27,30 @@ REGEX_DICT = {
     "workflow_pattern": re.compile(REGEX_FORMAT["model_workflow_id"]),
     "variant_pattern": re.compile(REGEX_FORMAT["variant_label"]),
 }
+# A single datetime parser is shared, since creating one compiles its full set of ISO 8601 patterns.
+TIMEPOINT_PARSER = parse.TimePointParser()
+# Format checks for individual fields, each returning True if the value is valid.
+FIELD_VALIDATORS = {
+    "model_workflow_id": lambda value: bool(REGEX_DICT["workflow_pattern"].fullmatch(value)),
+    "variant_label": lambda value: bool(REGEX_DICT["variant_pattern"].fullmatch(value)),
+    "atmos_timestep": lambda value: value.isdigit() and int(value) >= 0,
+}
 
 
-def get_metadata_files() -> list[str]:
+def get_metadata_files() -> list[Path]:
     """Creates a list of all existing cfg files to be checked.
 
     Returns
     -------
-    list[str]
+    list[Path]
         List of cfg files to be checked.
     """
-    glob_string = Path("workflow_metadata/*.cfg")
-    cfg_files = glob.glob(str(glob_string))
+    cfg_files = list(Path("workflow_metadata").glob("*.cfg"))
 
     return cfg_files
 
 
-def validate_structure(config: configparser, result: dict, file: str) -> dict:
+def validate_structure(config: configparser, result: dict, file: Path) -> dict:
     """Validates the structure of a single .cfg file.
 
     Parameters
@@ -54,7 +59,7 @@ def validate_structure(config: configparser, result: dict, file: str) -> dict:
         The config parser.
     result : dict
         The dictionary containing the details of any validation failures.
-    file : str
+    file : Path
         The file being validated.
 
     Returns
@@ -64,7 +69,6 @@ def validate_structure(config: configparser, result: dict, file: str) -> dict:
     """
     file_results = result[file]
     sections_in_config = set(config.sections())
-    SECTION_DICT = {"metadata": METADATA, "data": DATA, "misc": MISC}
 
     # Verify the correct sections are present in the correct order
     unexpected_sections = set()
@@ -73,13 +77,15 @@ def validate_structure(config: configparser, result: dict, file: str) -> dict:
         unexpected_sections = list(sections_in_config - SECTIONS)
         missing_sections = list(SECTIONS - sections_in_config)
 
-    # Verify the correct keys are in the correct section
-    for section in SECTIONS:
-        keys = set(config[section].keys()) if section in config else set()
-        target = set(SECTION_DICT[section])
+    # Verify the correct keys are in the correct section, collecting the differences across all sections
+    missing_keys = set()
+    unexpected_keys = set()
+    for section, target in SECTION_KEYS.items():
+        keys = set(config[section]) if section in sections_in_config else set()
 
-        missing_keys = target - keys
-        unexpected_keys = keys - target if section not in missing_sections else set()
+        missing_keys |= target - keys
+        if section not in missing_sections:
+            unexpected_keys |= keys - target
 
     if any([missing_keys, unexpected_keys, unexpected_sections, missing_sections]):
         file_results["failures"] = True
@@ -91,7 +97,7 @@ def validate_structure(config: configparser, result: dict, file: str) -> dict:
     return result
 
 
-def validate_required_fields(config: configparser, result: dict, file: str) -> dict:
+def validate_required_fields(config: configparser, result: dict, file: Path) -> dict:
     """Validates the contents of the required fields for a single .cfg file.
 
     Parameters
@@ -100,7 +106,7 @@ def validate_required_fields(config: configparser, result: dict, file: str) -> d
         The config parser.
     result : dict
         The dictionary containing the details of any validation failures.
-    file : str
+    file : Path
         The file being validated.
 
     Returns
@@ -109,31 +115,29 @@ def validate_required_fields(config: configparser, result: dict, file: str) -> d
         The dictionary containing the details of any validation failures.
     """
     file_results = result[file]
-    missing_values = set()
-    unexpected_values = set()
 
-    # Verify that all required fields are not None
+    # Flatten the sections once so that each check is a direct lookup rather than a scan of every key
+    values = {}
     for section in config.sections():
-        section_data = config[section]
-        for key, value in section_data.items():
-            if key in REQUIRED and not value:
-                missing_values.add(key)
-
-            if key == "branch_method":
-                if value == "standard":
-                    for parent_key in PARENT_REQUIRED:
-                        if section_data.get(parent_key) in (None, ""):
-                            missing_values.add(key)
-                elif value == "no parent":
-                    for parent_key in PARENT_REQUIRED:
-                        if section_data.get(parent_key) not in (None, ""):
-                            unexpected_values.add(key)
-
-            if key == "mass_data_class":
-                if value == "ens" and not section_data.get("mass_ensemble_member"):
-                    missing_values.add(key)
-                if value == "crum" and section_data.get("mass_ensemble_member"):
-                    unexpected_values.add(key)
+        values.update(config[section])
+
+    # Verify that all required fields are not None
+    missing_values = {key for key in REQUIRED if key in values and not values[key]}
+    unexpected_values = set()
+
+    branch_method = values.get("branch_method")
+    if branch_method == "standard":
+        if any(values.get(parent_key) in (None, "") for parent_key in PARENT_REQUIRED):
+            missing_values.add("branch_method")
+    elif branch_method == "no parent":
+        if any(values.get(parent_key) not in (None, "") for parent_key in PARENT_REQUIRED):
+            unexpected_values.add("branch_method")
+
+    mass_data_class = values.get("mass_data_class")
+    if mass_data_class == "ens" and not values.get("mass_ensemble_member"):
+        missing_values.add("mass_data_class")
+    if mass_data_class == "crum" and values.get("mass_ensemble_member"):
+        unexpected_values.add("mass_data_class")
 
     if any([missing_values, unexpected_values]):
         file_results["failures"] = True
@@ -143,7 +147,7 @@ def validate_required_fields(config: configparser, result: dict, file: str) -> d
     return result
 
 
-def validate_field_inputs(config: configparser, result: dict, file: str) -> dict:
+def validate_field_inputs(config: configparser, result: dict, file: Path) -> dict:
     """Validates the inputs of a single .cfg file.
 
     Parameters
@@ -152,7 +156,7 @@ def validate_field_inputs(config: configparser, result: dict, file: str) -> dict
         The config parser.
     result : dict
         The dictionary containing the details of any validation failures.
-    file : str
+    file : Path
         The file being validated.
 
     Returns
@@ -162,29 +166,23 @@ def validate_field_inputs(config: configparser, result: dict, file: str) -> dict
     """
     file_results = result[file]
     invalid_values = set()
-    parser = parse.TimePointParser()
+    # Branch dates are only checked for "standard" branching, regardless of where they appear relative to branch_method
+    if config.get("metadata", "branch_method", fallback=None) == "standard":
+        datetime_fields = DATETIME_FIELDS | BRANCH_DATETIME_FIELDS
+    else:
+        datetime_fields = DATETIME_FIELDS
     for section in config.sections():
         for key, value in config[section].items():
             # Verify datetime inputs
-            if key == "branch_method" and value == "standard":
-                DATETIME_FIELDS.add("branch_date_in_child")
-                DATETIME_FIELDS.add("branch_date_in_parent")
-            if key in DATETIME_FIELDS:
+            if key in datetime_fields:
                 try:
-                    parser.parse(value)
+                    TIMEPOINT_PARSER.parse(value)
                 except (IsodatetimeError, ISO8601SyntaxError):
                     invalid_values.add(key)
 
-            # Verify workflow model ID structure
-            if key == "model_workflow_id" and not REGEX_DICT["workflow_pattern"].fullmatch(value):
-                invalid_values.add(key)
-
-            # Verify variant label structure
-            if key == "variant_label" and not REGEX_DICT["variant_pattern"].fullmatch(value):
-                invalid_values.add(key)
-
-            # Verify that atmospheric timestep is an integer
-            if key == "atmos_timestep" and (not value.isdigit() or int(value) < 0):
+            # Verify workflow model ID structure, variant label structure and that atmospheric timestep is an integer
+            validator = FIELD_VALIDATORS.get(key)
+            if validator and not validator(value):
                 invalid_values.add(key)
 
             # Verify that no fields have the value "_No response_"
@@ -207,21 +205,23 @@ def create_failure_report(result: dict) -> None:
         The dictionary containing the details of any validation failures.
     """
     success = True
-    print("\nFILE VALIDATION FAILURE REPORT:\n")
+    report = ["\nFILE VALIDATION FAILURE REPORT:\n"]
     for f in result.values():
         if f["failures"]:
             success = False
-            print("=" * 60)
-            print(f"FILE: {f.get('file')}")
+            report.append("=" * 60)
+            report.append(f"FILE: {f.get('file')}")
             for key, value in f.items():
                 if value and key not in ("file", "failures"):
-                    print(f"    --> ERROR: {key.replace('_', ' ')}")
-                    print(f"        --> {', '.join(f.get(key))}")
+                    report.append(f"    --> ERROR: {key.replace('_', ' ')}")
+                    report.append(f"        --> {', '.join(f.get(key))}")
     if success:
-        print("=" * 60)
-        print("ALL FILES SUCCESSFULY VALIDATED")
+        report.append("=" * 60)
+        report.append("ALL FILES SUCCESSFULY VALIDATED")
 
-    else:
+    # Write the report in one go rather than a print per line
+    sys.stdout.write("\n".join(report) + "\n")
+    if not success:
         sys.exit(1)
 
 
@@ -236,18 +236,14 @@ def main() -> None:
             "failures": False,
         }
 
-        # A new parser must be created for each file since ConfigParser.read() is cumulative
+        # A new parser must be created for each file since reading into a ConfigParser is cumulative
         config = configparser.ConfigParser()
-        config.read(file)
+        config.read_string(file.read_text(encoding="utf-8"), source=str(file))
 
         # Perform validation
-        validators = [
-            validate_structure(config, result, file),
-            validate_required_fields(config, result, file),
-            validate_field_inputs(config, result, file),
-        ]
-        for v in validators:
-            result = v
+        result = validate_structure(config, result, file)
+        result = validate_required_fields(config, result, file)
+        result = validate_field_inputs(config, result, file)
 
     create_failure_report(result)
 